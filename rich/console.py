@@ -1944,6 +1944,10 @@ class Console:
         not_terminal = not self.is_terminal
         if self.no_color and color_system:
             buffer = Segment.remove_color(buffer)
+        if legacy_windows:
+            # Every style change is a console API call on legacy Windows,
+            # so render contiguous segments with the same style in one go
+            buffer = Segment.simplify(buffer)
         for text, style, control in buffer:
             if style:
                 append(
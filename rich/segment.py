@@ -512,15 +512,25 @@ class Segment(NamedTuple):
             return
 
         _Segment = Segment
+        texts: List[str] = [last_segment.text]
         for segment in iter_segments:
-            if last_segment.style == segment.style and not segment.control:
-                last_segment = _Segment(
-                    last_segment.text + segment.text, last_segment.style
-                )
+            if (
+                last_segment.style == segment.style
+                and not segment.control
+                and not last_segment.control
+            ):
+                texts.append(segment.text)
             else:
-                yield last_segment
+                if len(texts) > 1:
+                    yield _Segment("".join(texts), last_segment.style)
+                else:
+                    yield last_segment
                 last_segment = segment
-        yield last_segment
+                texts = [segment.text]
+        if len(texts) > 1:
+            yield _Segment("".join(texts), last_segment.style)
+        else:
+            yield last_segment
 
     @classmethod
     def strip_links(cls, segments: Iterable["Segment"]) -> Iterable["Segment"]:
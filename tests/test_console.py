@@ -22,7 +22,7 @@ from rich.measure import measure_renderables
 from rich.pager import SystemPager
 from rich.panel import Panel
 from rich.region import Region
-from rich.segment import Segment
+from rich.segment import ControlType, Segment
 from rich.status import Status
 from rich.style import Style
 from rich.text import Text
@@ -234,6 +234,46 @@ def test_print_style():
     assert console.file.getvalue() == "\x1b[1mfoo\x1b[0m\n"
 
 
+def test_render_buffer_legacy_windows():
+    console = Console(file=io.StringIO(), color_system="windows", legacy_windows=True)
+    console.print(Text.assemble(("foo", "bold"), ("bar", "bold"), "baz"), end="")
+    assert console.file.getvalue() == "\x1b[1mfoobar\x1b[0mbaz"
+
+
+@pytest.mark.parametrize("is_terminal", [True, False])
+def test_render_buffer_legacy_windows_control(is_terminal):
+    console = Console(
+        file=io.StringIO(),
+        color_system="windows",
+        force_terminal=is_terminal,
+        legacy_windows=True,
+    )
+    bold = Style(bold=True)
+    home = Segment("\x1b[H", None, [(ControlType.HOME,)])
+    buffer = [
+        Segment("foo", bold),
+        home,
+        Segment("bar", bold),
+        Segment("baz"),
+        home,
+        Segment("egg"),
+        Segment("\n"),
+    ]
+    control = "\x1b[H" if is_terminal else ""
+    assert console._render_buffer(buffer) == (
+        f"\x1b[1mfoo\x1b[0m{control}\x1b[1mbar\x1b[0mbaz{control}egg\n"
+    )
+
+
+def test_render_buffer_legacy_windows_long_run():
+    console = Console(file=io.StringIO(), color_system="windows", legacy_windows=True)
+    bold = Style(bold=True)
+    buffer = [Segment("abcdefghij"), Segment("\n")] * 5000
+    assert console._render_buffer(buffer) == "abcdefghij\n" * 5000
+    buffer = [Segment("foo", bold)] * 5000
+    assert console._render_buffer(buffer) == f"\x1b[1m{'foo' * 5000}\x1b[0m"
+
+
 def test_show_cursor():
     console = Console(
         file=io.StringIO(), force_terminal=True, legacy_windows=False, _environ={}
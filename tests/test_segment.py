@@ -86,6 +86,10 @@ def test_simplify():
         )
     ) == [Segment("Hello ", "red"), Segment("World!", "blue")]
     assert list(Segment.simplify([])) == []
+    control_code = (ControlType.HOME, 0)
+    assert list(
+        Segment.simplify([Segment("\x1b[H", None, (control_code,)), Segment("foo")])
+    ) == [Segment("\x1b[H", None, (control_code,)), Segment("foo")]
 
 
 def test_filter_control():
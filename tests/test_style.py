@@ -162,6 +162,14 @@ def test_render():
     assert Style().render("foo") == "foo"
 
 
+def test_render_color_systems():
+    style = Style(color="#ff8800")
+    assert style.render("foo") == "\x1b[38;2;255;136;0mfoo\x1b[0m"
+    assert (
+        style.render("foo", color_system=ColorSystem.WINDOWS) == "\x1b[33mfoo\x1b[0m"
+    )
+
+
 def test_test():
     Style(color="red").test("hello")
 